@@ -1,12 +1,18 @@
 # DRY Principle Example in Python
 # Use Case: User management system with validation and formatting
 
+import logging
+import os
 import re
+import string
+import sys
 import uuid
 from datetime import datetime
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
 
 # ❌ WET (Write Everything Twice) - BEFORE DRY
 # This code violates DRY principles with lots of duplication
@@ -22,13 +28,14 @@ class UserManagerWET:
             raise ValueError("Password too short")
         
         # Repeated formatting logic
+        now = datetime.now().isoformat()
         user = {
             'id': str(uuid.uuid4()),
             'email': user_data['email'].lower().strip(),
             'name': user_data['name'].strip(),
             'password': user_data['password'],
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
+            'created_at': now,
+            'updated_at': now
         }
         
         print(f"User created: {user['name']} ({user['email']})")
@@ -66,13 +73,56 @@ class ValidationRules:
     PASSWORD_MIN_LENGTH: int = 8
     EMAIL_PATTERN: str = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 
+@dataclass(slots=True)
+class User:
+    """Fixed-layout user record; use dataclasses.asdict(user) where a dict is needed"""
+    id: str
+    email: str
+    name: str
+    password: Optional[str]
+    updated_at: str
+    created_at: Optional[str] = None
+
+# Compile the pattern once instead of on every validation call
+_EMAIL_RE = re.compile(ValidationRules.EMAIL_PATTERN)
+
+# Character sets mirroring EMAIL_PATTERN, built once at import
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+_PASSWORD_UPPER = frozenset(string.ascii_uppercase)
+_PASSWORD_DIGITS = frozenset(string.digits)
+
+def _scan_email(email: str) -> bool:
+    """Linear scan equivalent of EMAIL_PATTERN using only C-level str/set operations"""
+    at = email.find('@')
+    if at < 1:
+        return False
+    local, domain = email[:at], email[at + 1:]
+    dot = domain.rfind('.')
+    if dot < 1 or len(domain) - dot - 1 < 2:
+        return False
+    return (_EMAIL_LOCAL_CHARS.issuperset(local)
+            and _EMAIL_DOMAIN_CHARS.issuperset(domain)
+            and _EMAIL_TLD_CHARS.issuperset(domain[dot + 1:]))
+
+@lru_cache(maxsize=4096)
+def _is_valid_email_format(email: str, strict: bool) -> bool:
+    """Memoized format check; bulk imports often re-validate the same address"""
+    return bool(_EMAIL_RE.match(email)) if strict else _scan_email(email)
+
 # 2. Extract utility classes
 class ValidationUtils:
     @staticmethod
-    def validate_email(email: str) -> None:
+    def validate_email(email: str, strict: bool = False) -> None:
         if not email or len(email) < ValidationRules.EMAIL_MIN_LENGTH:
             raise ValueError("Invalid email")
-        if not re.match(ValidationRules.EMAIL_PATTERN, email):
+        # Reject obviously malformed input before touching the (cached) full check
+        at = email.rfind('@')
+        if at < 1 or '.' not in email[at:]:
+            raise ValueError("Invalid email format")
+        # strict mode runs the full regex; the default scanner checks the same character classes
+        if not _is_valid_email_format(email, strict):
             raise ValueError("Invalid email format")
     
     @staticmethod
@@ -81,11 +131,16 @@ class ValidationUtils:
             raise ValueError("Invalid name")
     
     @staticmethod
-    def validate_password(password: str, required: bool = True) -> None:
-        if required and (not password or len(password) < ValidationRules.PASSWORD_MIN_LENGTH):
-            raise ValueError("Password too short")
-        if not required and password and len(password) < ValidationRules.PASSWORD_MIN_LENGTH:
+    def validate_password(password: str, required: bool = True, strong: bool = False) -> None:
+        # A missing password counts as length 0, so one comparison covers both modes
+        if (required or password) and len(password or '') < ValidationRules.PASSWORD_MIN_LENGTH:
             raise ValueError("Password too short")
+        # Opt-in strength rules; set membership instead of re.search(r'[A-Z]', ...) is a single C-level scan
+        if strong and password:
+            if _PASSWORD_UPPER.isdisjoint(password):
+                raise ValueError("Password needs an uppercase letter")
+            if _PASSWORD_DIGITS.isdisjoint(password):
+                raise ValueError("Password needs a digit")
 
 class FormattingUtils:
     @staticmethod
@@ -98,63 +153,119 @@ class FormattingUtils:
     
     @staticmethod
     def generate_id() -> str:
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
+    
+    @staticmethod
+    def generate_ids(count: int) -> List[str]:
+        """Generate many IDs from a single os.urandom call"""
+        buffer = os.urandom(16 * count)
+        return [uuid.UUID(bytes=buffer[i:i + 16], version=4).hex for i in range(0, 16 * count, 16)]
     
     @staticmethod
     def get_current_timestamp() -> str:
         return datetime.now().isoformat()
 
+# Module-level references to the plain functions behind the staticmethods,
+# so hot paths skip the class attribute lookup on every call
+_format_email = FormattingUtils.format_email
+_format_name = FormattingUtils.format_name
+_generate_id = FormattingUtils.generate_id
+_current_timestamp = FormattingUtils.get_current_timestamp
+
 # 3. Extract logging functionality
 class UserLogger:
     @staticmethod
-    def log_user_created(user: Dict[str, Any]) -> None:
-        print(f"User created: {user['name']} ({user['email']})")
+    def log_user_created(user: User) -> None:
+        # %-style args are only formatted if a handler actually emits the record
+        logger.info("User created: %s (%s)", user.name, user.email)
     
     @staticmethod
-    def log_user_updated(user: Dict[str, Any]) -> None:
-        print(f"User updated: {user['name']} ({user['email']})")
+    def log_user_updated(user: User) -> None:
+        logger.info("User updated: %s (%s)", user.name, user.email)
 
 # 4. Base class with common functionality
-class BaseUserManager(ABC):
+class BaseUserManager:
     def validate_user_data(self, user_data: Dict[str, Any], is_update: bool = False) -> None:
         """Single source of truth for validation"""
-        ValidationUtils.validate_email(user_data.get('email', ''))
-        ValidationUtils.validate_name(user_data.get('name', ''))
+        # Cheapest checks first: plain len() comparisons before the email format check
         ValidationUtils.validate_password(user_data.get('password', ''), not is_update)
+        ValidationUtils.validate_name(user_data.get('name', ''))
+        ValidationUtils.validate_email(user_data.get('email', ''))
     
-    def format_user_data(self, user_data: Dict[str, Any], user_id: Optional[str] = None) -> Dict[str, Any]:
-        """Single source of truth for formatting"""
-        timestamp = FormattingUtils.get_current_timestamp()
-        
-        formatted_data = {
-            'id': user_id or FormattingUtils.generate_id(),
-            'email': FormattingUtils.format_email(user_data['email']),
-            'name': FormattingUtils.format_name(user_data['name']),
-            'password': user_data.get('password'),
-            'updated_at': timestamp
-        }
+    def format_user_data(self, user_data: Dict[str, Any], user_id: Optional[str] = None,
+                         timestamp: Optional[str] = None, new_id: Optional[str] = None) -> User:
+        """Single source of truth for formatting; batch callers pass a shared timestamp and pre-generated new_id"""
+        timestamp = timestamp or _current_timestamp()
         
-        if not user_id:  # New user
-            formatted_data['created_at'] = timestamp
-            
-        return formatted_data
+        return User(
+            id=user_id or new_id or _generate_id(),
+            email=_format_email(user_data['email']),
+            name=_format_name(user_data['name']),
+            password=user_data.get('password'),
+            updated_at=timestamp,
+            created_at=None if user_id else timestamp  # Only set for new users
+        )
 
 # 5. Main class using DRY principles
 class UserManagerDRY(BaseUserManager):
-    def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_user(self, user_data: Dict[str, Any]) -> User:
         self.validate_user_data(user_data)
         user = self.format_user_data(user_data)
         UserLogger.log_user_created(user)
         return user
     
-    def update_user(self, user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    def update_user(self, user_id: str, user_data: Dict[str, Any]) -> User:
         self.validate_user_data(user_data, is_update=True)
         updated_user = self.format_user_data(user_data, user_id)
         UserLogger.log_user_updated(updated_user)
         return updated_user
+    
+    def create_users(self, users_data: List[Dict[str, Any]]) -> List[User]:
+        """Bulk create: one timestamp, one random-ID buffer and one log record per batch"""
+        timestamp = _current_timestamp()
+        ids = FormattingUtils.generate_ids(len(users_data))
+        users = []
+        for user_data, new_id in zip(users_data, ids):
+            self.validate_user_data(user_data)
+            users.append(self.format_user_data(user_data, timestamp=timestamp, new_id=new_id))
+        logger.info("Created %d users", len(users))
+        return users
+
+# 5b. Hot-path variant: the same rules inlined into one frame
+# Deliberately trades DRY for throughput - every helper call above costs a Python frame,
+# so bulk callers can use this class while the helpers stay the readable source of truth
+class UserManagerFast(UserManagerDRY):
+    def create_user(self, user_data: Dict[str, Any]) -> User:
+        email = user_data.get('email', '')
+        name = user_data.get('name', '')
+        password = user_data.get('password', '')
+        
+        # Inlined ValidationUtils checks, cheapest first
+        if not password or len(password) < ValidationRules.PASSWORD_MIN_LENGTH:
+            raise ValueError("Password too short")
+        if not name or len(name) < ValidationRules.NAME_MIN_LENGTH:
+            raise ValueError("Invalid name")
+        if not email or len(email) < ValidationRules.EMAIL_MIN_LENGTH:
+            raise ValueError("Invalid email")
+        at = email.rfind('@')
+        if at < 1 or '.' not in email[at:] or not _is_valid_email_format(email, False):
+            raise ValueError("Invalid email format")
+        
+        # Inlined FormattingUtils calls
+        timestamp = datetime.now().isoformat()
+        user = User(
+            id=uuid.uuid4().hex,
+            email=email.lower().strip(),
+            name=name.strip(),
+            password=password,
+            updated_at=timestamp,
+            created_at=timestamp
+        )
+        logger.info("User created: %s (%s)", user.name, user.email)
+        return user
 
 # 6. Configuration-driven approach (further DRY improvement)
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserManagerConfig:
     email_min_length: int = 5
     name_min_length: int = 2
@@ -164,7 +275,15 @@ class UserManagerConfig:
 
 class ConfigurableUserManager:
     def __init__(self, config: Optional[UserManagerConfig] = None):
-        self.config = config or UserManagerConfig()
+        self._config = config = config or UserManagerConfig()
+        # Snapshot the config values read on every validation call (the config is frozen)
+        self._thresholds = (config.email_min_length, config.name_min_length, config.password_min_length)
+        self._email_re = re.compile(config.email_pattern)
+    
+    @property
+    def config(self) -> UserManagerConfig:
+        """Read-only: the validation snapshot above is taken from this config"""
+        return self._config
     
     def _validate_field(self, field_name: str, value: str, min_length: int) -> None:
         """Generic validation method - single source of truth"""
@@ -175,47 +294,45 @@ class ConfigurableUserManager:
         email = user_data.get('email', '')
         name = user_data.get('name', '')
         password = user_data.get('password', '')
+        email_min, name_min, password_min = self._thresholds
         
-        self._validate_field('email', email, self.config.email_min_length)
-        if not re.match(self.config.email_pattern, email):
-            raise ValueError("Invalid email format")
+        # Cheapest checks first; the regex only runs once everything else has passed
+        if not is_update or password:
+            self._validate_field('password', password, password_min)
         
-        self._validate_field('name', name, self.config.name_min_length)
+        self._validate_field('name', name, name_min)
         
-        if not is_update or password:
-            self._validate_field('password', password, self.config.password_min_length)
+        self._validate_field('email', email, email_min)
+        if '@' not in email or not self._email_re.match(email):
+            raise ValueError("Invalid email format")
     
-    def format_user_data(self, user_data: Dict[str, Any], user_id: Optional[str] = None) -> Dict[str, Any]:
-        timestamp = FormattingUtils.get_current_timestamp()
+    def format_user_data(self, user_data: Dict[str, Any], user_id: Optional[str] = None) -> User:
+        timestamp = _current_timestamp()
         
-        formatted_data = {
-            'id': user_id or FormattingUtils.generate_id(),
-            'email': FormattingUtils.format_email(user_data['email']),
-            'name': FormattingUtils.format_name(user_data['name']),
-            'password': user_data.get('password'),
-            'updated_at': timestamp
-        }
-        
-        if not user_id:
-            formatted_data['created_at'] = timestamp
-            
-        return formatted_data
+        return User(
+            id=user_id or _generate_id(),
+            email=_format_email(user_data['email']),
+            name=_format_name(user_data['name']),
+            password=user_data.get('password'),
+            updated_at=timestamp,
+            created_at=None if user_id else timestamp
+        )
     
-    def _log(self, message: str) -> None:
-        """Configurable logging"""
+    def _log(self, template: str, *args: Any) -> None:
+        """Configurable logging; args are only formatted when logging is enabled"""
         if self.config.logging_enabled:
-            print(message)
+            logger.info(template, *args)
     
-    def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_user(self, user_data: Dict[str, Any]) -> User:
         self.validate_user_data(user_data)
         user = self.format_user_data(user_data)
-        self._log(f"User created: {user['name']} ({user['email']})")
+        self._log("User created: %s (%s)", user.name, user.email)
         return user
     
-    def update_user(self, user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    def update_user(self, user_id: str, user_data: Dict[str, Any]) -> User:
         self.validate_user_data(user_data, is_update=True)
         updated_user = self.format_user_data(user_data, user_id)
-        self._log(f"User updated: {updated_user['name']} ({updated_user['email']})")
+        self._log("User updated: %s (%s)", updated_user.name, updated_user.email)
         return updated_user
 
 # 7. Advanced DRY: Decorator pattern for cross-cutting concerns
@@ -267,6 +384,8 @@ class AdvancedUserManager:
 
 # Usage Examples
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("=== WET Example ===")
     wet_manager = UserManagerWET()
     user1 = wet_manager.create_user({
@@ -1,7 +1,7 @@
 # SOLID Principles Example in Python
 # Use Case: Sending notifications (email, SMS, push)
 
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 # ------------------------
 # S — Single Responsibility Principle
@@ -30,9 +30,20 @@ class NotificationService:
     def __init__(self, senders: list):
         self.senders = senders  # List of sender objects
 
+    @property
+    def senders(self) -> tuple:
+        return self._senders
+
+    @senders.setter
+    def senders(self, senders: list):
+        # Stored as a tuple so the pre-bound send methods can't go stale;
+        # reassign senders to add or remove one
+        self._senders = tuple(senders)
+        self._sends = tuple(sender.send for sender in self._senders)
+
     def notify(self, message: Message):
-        for sender in self.senders:
-            sender.send(message)
+        for send in self._sends:
+            send(message)
 
 # ------------------------
 # L — Liskov Substitution Principle
@@ -48,14 +59,16 @@ class PushSender:
 # Each sender only needs to implement send()
 # ------------------------
 
-# Python doesn't enforce interfaces, but we can use abstract base classes for clarity
+# Python doesn't enforce interfaces, but a Protocol describes one structurally:
+# senders don't need to inherit from it
 
-class SenderInterface(ABC):
-    @abstractmethod
+@runtime_checkable
+class SenderInterface(Protocol):
     def send(self, message: Message):
-        pass
+        ...
 
 # EmailSender, SMSSender, and PushSender already conform to this "interface"
+# (isinstance(EmailSender(), SenderInterface) is True)
 
 # ------------------------
 # D — Dependency Inversion Principle